@@ -13,6 +13,7 @@ class BaseLeague(ABC):
         self.league_id = league_id
         self.year = year
         self.teams = []
+        self._team_by_id = {}
         self.members = []
         self.draft = []
         self.player_map = {}
@@ -85,6 +86,7 @@ class BaseLeague(ABC):
 
         # sort by team ID
         self.teams = sorted(self.teams, key=lambda x: x.team_id, reverse=False)
+        self._team_by_id = {team.team_id: team for team in self.teams}
 
     def _fetch_players(self):
         data = self.espn_request.get_pro_players()
@@ -121,11 +123,8 @@ class BaseLeague(ABC):
         return pro_team_schedule
 
     def standings(self) -> List:
-        standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
+        standings = sorted(self.teams, key=lambda x: x.final_standing or x.standing)
         return standings
 
     def get_team_data(self, team_id: int) -> List:
-        for team in self.teams:
-            if team_id == team.team_id:
-                return team
-        return None
+        return self._team_by_id.get(team_id)
@@ -1,11 +1,11 @@
 import datetime
 import time
-import json
 import math
 from typing import List, Tuple, Union
 import pdb
 
 from ..base_league import BaseLeague
+from ..utils.utils import json_dumps
 from .team import Team
 from .player import Player
 from .matchup import Matchup
@@ -50,15 +50,12 @@ class League(BaseLeague):
         # replace opponentIds in schedule with team instances
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup.away_team == opponent.team_id:
-                        matchup.away_team = opponent
-                    if matchup.home_team == opponent.team_id:
-                        matchup.home_team = opponent
+            for matchup in team.schedule:
+                matchup.away_team = self._team_by_id.get(matchup.away_team, matchup.away_team)
+                matchup.home_team = self._team_by_id.get(matchup.home_team, matchup.home_team)
 
     def standings(self) -> List[Team]:
-        standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
+        standings = sorted(self.teams, key=lambda x: x.final_standing or x.standing)
         return standings
 
     def scoreboard(self, matchupPeriod: int = None) -> List[Matchup]:
@@ -69,16 +66,15 @@ class League(BaseLeague):
         params = {
             'view': 'mMatchup',
         }
-        data = self.espn_request.league_get(params=params)
+        filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchupPeriod]}}}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
+        data = self.espn_request.league_get(params=params, headers=headers)
         schedule = data['schedule']
         matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == matchupPeriod]
 
-        for team in self.teams:
-            for matchup in matchups:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in matchups:
+            matchup.home_team = self._team_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._team_by_id.get(matchup.away_team, matchup.away_team)
 
         return matchups
 
@@ -95,7 +91,7 @@ class League(BaseLeague):
         }
 
         filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":25},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
         data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
         data = data['topics']
         activity = [Activity(topic, self.player_map, self.get_team_data) for topic in data]
@@ -123,7 +119,7 @@ class League(BaseLeague):
             'scoringPeriodId': week,
         }
         filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
 
         data = self.espn_request.league_get(params=params, headers=headers)
         players = data['players']
@@ -149,17 +145,14 @@ class League(BaseLeague):
         }
 
         filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchup_id]}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
         data = self.espn_request.league_get(params=params, headers=headers)
         pro_schedule = self._get_pro_schedule(scoring_id)
 
         schedule = data['schedule']
         box_data = [self._box_score_class(matchup, pro_schedule, self.year, scoring_id) for matchup in schedule]
 
-        for team in self.teams:
-            for matchup in box_data:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in box_data:
+            matchup.home_team = self._team_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._team_by_id.get(matchup.away_team, matchup.away_team)
         return box_data
@@ -1,19 +1,20 @@
 from .constant import POSITION_MAP, PRO_TEAM_MAP, STATS_MAP
-from .utils import json_parsing
+from espn_api.utils.utils import json_index
 import pdb
 
 class Player(object):
     '''Player are part of team'''
     def __init__(self, data, year):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.position = POSITION_MAP.get(json_parsing(data, 'defaultPositionId') - 1, json_parsing(data, 'defaultPositionId') - 1)
+        parsed = json_index(data)
+        self.name = parsed['fullName']
+        self.playerId = parsed['id']
+        self.position = POSITION_MAP.get(parsed['defaultPositionId'] - 1, parsed['defaultPositionId'] - 1)
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP.get(pos, pos) for pos in json_parsing(data, 'eligibleSlots')]  # if position isn't in position map, just use the position id number
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP.get(json_parsing(data, 'proTeamId'), json_parsing(data, 'proTeamId'))
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.status = json_parsing(data, 'status')
+        self.eligibleSlots = [POSITION_MAP.get(pos, pos) for pos in parsed['eligibleSlots']]  # if position isn't in position map, just use the position id number
+        self.acquisitionType = parsed['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP.get(parsed['proTeamId'], parsed['proTeamId'])
+        self.injuryStatus = parsed['injuryStatus']
+        self.status = parsed['status']
         self.stats = {}
 
         player = data.get('playerPoolEntry', {}).get('player') or data['player']
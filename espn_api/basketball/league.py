@@ -1,7 +1,9 @@
-import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Set, Union
 
 from ..base_league import BaseLeague
+from ..utils.utils import json_dumps
 from .team import Team
 from .player import Player
 from .matchup import Matchup
@@ -34,15 +36,17 @@ class League(BaseLeague):
         return(data)
 
     def _map_matchup_ids(self, schedule):
-        self.matchup_ids = {}
+        matchup_ids = defaultdict(set)
         for match in schedule:
-            matchup_period = match.get('matchupPeriodId')
-            scoring_periods = match.get('home', {}).get('pointsByScoringPeriod', {}).keys()
-            if len(scoring_periods) > 0:
-                if matchup_period not in self.matchup_ids:
-                    self.matchup_ids[matchup_period] = sorted(scoring_periods)
-                else:
-                    self.matchup_ids[matchup_period] = sorted(set(self.matchup_ids[matchup_period] + list(scoring_periods)))
+            scoring_periods = match.get('home', {}).get('pointsByScoringPeriod', {})
+            if scoring_periods:
+                matchup_ids[match.get('matchupPeriodId')].update(scoring_periods)
+        self.matchup_ids = {matchup_period: sorted(periods) for matchup_period, periods in matchup_ids.items()}
+        # reverse lookup of scoring period -> first matchup period containing it
+        self._scoring_to_matchup = {}
+        for matchup_period, periods in self.matchup_ids.items():
+            for scoring_period in periods:
+                self._scoring_to_matchup.setdefault(scoring_period, matchup_period)
 
 
     def _fetch_teams(self, data):
@@ -53,15 +57,12 @@ class League(BaseLeague):
         # replace opponentIds in schedule with team instances
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup.away_team == opponent.team_id:
-                        matchup.away_team = opponent
-                    if matchup.home_team == opponent.team_id:
-                        matchup.home_team = opponent
+            for matchup in team.schedule:
+                matchup.away_team = self._team_by_id.get(matchup.away_team, matchup.away_team)
+                matchup.home_team = self._team_by_id.get(matchup.home_team, matchup.home_team)
 
     def standings(self) -> List[Team]:
-        standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
+        standings = sorted(self.teams, key=lambda x: x.final_standing or x.standing)
         return standings
 
     def scoreboard(self, matchupPeriod: int = None) -> List[Matchup]:
@@ -72,16 +73,15 @@ class League(BaseLeague):
         params = {
             'view': 'mMatchup',
         }
-        data = self.espn_request.league_get(params=params)
+        filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchupPeriod]}}}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
+        data = self.espn_request.league_get(params=params, headers=headers)
         schedule = data['schedule']
         matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == matchupPeriod]
 
-        for team in self.teams:
-            for matchup in matchups:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in matchups:
+            matchup.home_team = self._team_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._team_by_id.get(matchup.away_team, matchup.away_team)
 
         return matchups
 
@@ -98,7 +98,7 @@ class League(BaseLeague):
         }
 
         filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":25},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
         data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
         data = data['topics']
         activity = [Activity(topic, self.player_map, self.get_team_data, include_moved=include_moved) for topic in data]
@@ -119,7 +119,7 @@ class League(BaseLeague):
         }
 
         filters = {"transactions":{"filterType":{"value":list(types)}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
 
         data = self.espn_request.league_get(params=params, headers=headers)
         transactions = data['transactions']
@@ -147,7 +147,7 @@ class League(BaseLeague):
             'scoringPeriodId': week,
         }
         filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
 
         data = self.espn_request.league_get(params=params, headers=headers)
         players = data['players']
@@ -169,10 +169,7 @@ class League(BaseLeague):
             scoring_id = self.matchup_ids[matchup_period][-1] if matchup_period in self.matchup_ids else 1
         elif scoring_period and scoring_period <= scoring_id:
             scoring_id = scoring_period
-            for matchup in self.matchup_ids.keys():
-                if str(scoring_id) in self.matchup_ids[matchup]:
-                    matchup_id = matchup
-                    break
+            matchup_id = self._scoring_to_matchup.get(str(scoring_id), matchup_id)
 
         params = {
             'view': ['mMatchupScore', 'mScoreboard'],
@@ -180,18 +177,15 @@ class League(BaseLeague):
         }
 
         filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchup_id]}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
         data = self.espn_request.league_get(params=params, headers=headers)
 
         schedule = data['schedule']
         box_data = [self.BoxScoreClass(matchup, self.pro_schedule, matchup_total, self.year, scoring_id) for matchup in schedule]
 
-        for team in self.teams:
-            for matchup in box_data:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in box_data:
+            matchup.home_team = self._team_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._team_by_id.get(matchup.away_team, matchup.away_team)
         return box_data
 
     def player_info(self, name: str = None, playerId: Union[int, list] = None, include_news = False) -> Union[Player, List[Player]]:
@@ -207,9 +201,14 @@ class League(BaseLeague):
         data = self.espn_request.get_player_card(playerId, self.finalScoringPeriod)
 
         if include_news:
-            news = {}
-            for id in playerId:
-                news[id] = self.espn_request.get_player_news(id)
+            if len(playerId) <= 1:
+                news = {player_id: self.espn_request.get_player_news(player_id) for player_id in playerId}
+            else:
+                # news is one request per player, fetch them concurrently. The workers share
+                # espn_request's Session; requests doesn't promise it is thread safe, but these
+                # are plain GETs that only touch the (thread safe) urllib3 pool and cookie jar
+                with ThreadPoolExecutor(max_workers=min(8, len(playerId))) as executor:
+                    news = dict(zip(playerId, executor.map(self.espn_request.get_player_news, playerId)))
 
         if len(data['players']) == 1:
             return Player(data['players'][0], self.year, self.pro_schedule, news=news.get(playerId[0], []) if include_news else None)
@@ -1,29 +1,30 @@
 from .constant import NINE_CAT_STATS, POSITION_MAP, PRO_TEAM_MAP, STATS_MAP, STAT_ID_MAP
-from espn_api.utils.utils import json_parsing
+from espn_api.utils.utils import json_index
 from datetime import datetime
 from functools import cached_property
 
 class Player(object):
     '''Player are part of team'''
     def __init__(self, data, year, pro_team_schedule = None, news = None):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
+        parsed = json_index(data)
+        self.name = parsed['fullName']
+        self.playerId = parsed['id']
         self.year = year
-        self.position = POSITION_MAP[json_parsing(data, 'defaultPositionId') - 1]
+        self.position = POSITION_MAP[parsed['defaultPositionId'] - 1]
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP[pos] for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP[json_parsing(data, 'proTeamId')]
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.posRank = json_parsing(data, 'positionalRanking')
+        self.eligibleSlots = [POSITION_MAP[pos] for pos in parsed['eligibleSlots']]
+        self.acquisitionType = parsed['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP[parsed['proTeamId']]
+        self.injuryStatus = parsed['injuryStatus']
+        self.posRank = parsed['positionalRanking']
         self.stats = {}
         self.schedule = {}
         self.news = {}
-        expected_return_date = json_parsing(data, 'expectedReturnDate')
+        expected_return_date = parsed['expectedReturnDate']
         self.expected_return_date = datetime(*expected_return_date).date() if expected_return_date else None
 
         if pro_team_schedule:
-            pro_team_id = json_parsing(data, 'proTeamId')
+            pro_team_id = parsed['proTeamId']
             pro_team = pro_team_schedule.get(pro_team_id, {})
             for key in pro_team:
                 game = pro_team[key][0]
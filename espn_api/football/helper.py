@@ -209,3 +209,32 @@ def sort_team_data_list(
         )
 
     return sorted_team_data_list
+
+
+# Tiebreaker functions and the team data column each one sorts by, keyed by playoff_seed_tie_rule
+TIEBREAKER_HIERARCHIES = {
+    "TOTAL_POINTS_SCORED": (
+        (sort_by_win_pct, "win_pct"),
+        (sort_by_points_for, "points_for"),
+        (sort_by_head_to_head, "h2h_wins"),
+        (sort_by_division_record, "division_record"),
+        (sort_by_points_against, "points_against"),
+        (sort_by_coin_flip, "coin_flip"),
+    ),
+    "H2H_RECORD": (
+        (sort_by_win_pct, "win_pct"),
+        (sort_by_head_to_head, "h2h_wins"),
+        (sort_by_points_for, "points_for"),
+        (sort_by_division_record, "division_record"),
+        (sort_by_points_against, "points_against"),
+        (sort_by_coin_flip, "coin_flip"),
+    ),
+    "INTRA_DIVISION_RECORD": (
+        (sort_by_division_record, "division_record"),
+        (sort_by_head_to_head, "h2h_wins"),
+        (sort_by_win_pct, "win_pct"),
+        (sort_by_points_for, "points_for"),
+        (sort_by_points_against, "points_against"),
+        (sort_by_coin_flip, "coin_flip"),
+    ),
+}
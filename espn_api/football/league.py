@@ -1,8 +1,8 @@
-import json
 import random
 from typing import Callable, Dict, List, Set, Tuple, Union
 
 from ..base_league import BaseLeague
+from ..utils.utils import json_dumps
 from .team import Team
 from .matchup import Matchup
 from .box_score import BoxScore
@@ -13,15 +13,7 @@ from .settings import Settings
 from .utils import power_points, two_step_dominance
 from .constant import POSITION_MAP, ACTIVITY_MAP, TRANSACTION_TYPES
 from .transaction import Transaction
-from .helper import (
-    sort_by_coin_flip,
-    sort_by_division_record,
-    sort_by_head_to_head,
-    sort_by_points_against,
-    sort_by_points_for,
-    sort_by_win_pct,
-    sort_team_data_list,
-)
+from .helper import TIEBREAKER_HIERARCHIES, sort_team_data_list
 
 
 class League(BaseLeague):
@@ -51,10 +43,8 @@ class League(BaseLeague):
         # replace opponentIds in schedule with team instances
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup == opponent.team_id:
-                        team.schedule[week] = opponent
+            for week, opponent_id in enumerate(team.schedule):
+                team.schedule[week] = self._team_by_id.get(opponent_id, opponent_id)
 
         # calculate margin of victory
         for team in self.teams:
@@ -109,7 +99,7 @@ class League(BaseLeague):
             team._fetch_roster(roster, self.year)
 
     def standings(self) -> List[Team]:
-        standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
+        standings = sorted(self.teams, key=lambda x: x.final_standing or x.standing)
         return standings
 
     def standings_weekly(self, week: int) -> List[Team]:
@@ -160,34 +150,8 @@ class League(BaseLeague):
             list_of_team_data.append(team_data)
 
         # Identify the proper tiebreaker hierarchy
-        if self.settings.playoff_seed_tie_rule == "TOTAL_POINTS_SCORED":
-            tiebreaker_hierarchy = [
-                (sort_by_win_pct, "win_pct"),
-                (sort_by_points_for, "points_for"),
-                (sort_by_head_to_head, "h2h_wins"),
-                (sort_by_division_record, "division_record"),
-                (sort_by_points_against, "points_against"),
-                (sort_by_coin_flip, "coin_flip"),
-            ]
-        elif self.settings.playoff_seed_tie_rule == "H2H_RECORD":
-            tiebreaker_hierarchy = [
-                (sort_by_win_pct, "win_pct"),
-                (sort_by_head_to_head, "h2h_wins"),
-                (sort_by_points_for, "points_for"),
-                (sort_by_division_record, "division_record"),
-                (sort_by_points_against, "points_against"),
-                (sort_by_coin_flip, "coin_flip"),
-            ]
-        elif self.settings.playoff_seed_tie_rule == "INTRA_DIVISION_RECORD":
-            tiebreaker_hierarchy = [
-                (sort_by_division_record, "division_record"),
-                (sort_by_head_to_head, "h2h_wins"),
-                (sort_by_win_pct, "win_pct"),
-                (sort_by_points_for, "points_for"),
-                (sort_by_points_against, "points_against"),
-                (sort_by_coin_flip, "coin_flip"),
-            ]
-        else:
+        tiebreaker_hierarchy = TIEBREAKER_HIERARCHIES.get(self.settings.playoff_seed_tie_rule)
+        if tiebreaker_hierarchy is None:
             raise ValueError(
                 "Unkown tiebreaker_method: Must be either 'TOTAL_POINTS_SCORED', 'H2H_RECORD', or 'INTRA_DIVISION_RECORD'"
             )
@@ -263,7 +227,7 @@ class League(BaseLeague):
         }
 
         filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":25},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
         data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
         data = data['topics']
         activity = [Activity(topic, self.player_map, self.get_team_data, self.player_info) for topic in data]
@@ -278,17 +242,18 @@ class League(BaseLeague):
         params = {
             'view': 'mMatchupScore',
         }
-        data = self.espn_request.league_get(params=params)
+        filters = {"schedule":{"filterMatchupPeriodIds":{"value":[week]}}}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
+        data = self.espn_request.league_get(params=params, headers=headers)
 
         schedule = data['schedule']
         matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == week]
 
-        for team in self.teams:
-            for matchup in matchups:
-                if matchup._home_team_id == team.team_id:
-                    matchup.home_team = team
-                elif matchup._away_team_id == team.team_id:
-                    matchup.away_team = team
+        for matchup in matchups:
+            if matchup._home_team_id in self._team_by_id:
+                matchup.home_team = self._team_by_id[matchup._home_team_id]
+            if matchup._away_team_id in self._team_by_id:
+                matchup.away_team = self._team_by_id[matchup._away_team_id]
 
         return matchups
 
@@ -312,7 +277,7 @@ class League(BaseLeague):
         }
 
         filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchup_period]}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
         data = self.espn_request.league_get(params=params, headers=headers)
 
         schedule = data['schedule']
@@ -320,12 +285,9 @@ class League(BaseLeague):
         positional_rankings = self._get_positional_ratings(scoring_period)
         box_data = [BoxScore(matchup, pro_schedule, positional_rankings, scoring_period, self.year) for matchup in schedule]
 
-        for team in self.teams:
-            for matchup in box_data:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in box_data:
+            matchup.home_team = self._team_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._team_by_id.get(matchup.away_team, matchup.away_team)
         return box_data
 
     def power_rankings(self, week: int=None):
@@ -370,7 +332,7 @@ class League(BaseLeague):
             'scoringPeriodId': week,
         }
         filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
 
         data = self.espn_request.league_get(params=params, headers=headers)
 
@@ -423,7 +385,7 @@ class League(BaseLeague):
         }
 
         filters = {"transactions":{"filterType":{"value":list(types)}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
 
         data = self.espn_request.league_get(params=params, headers=headers)
         if 'transactions' not in data:
@@ -1,31 +1,32 @@
 from .constant import POSITION_MAP, PRO_TEAM_MAP, PLAYER_STATS_MAP
-from .utils import json_parsing
+from espn_api.utils.utils import json_index
 from datetime import datetime
 
 class Player(object):
     '''Player are part of team'''
     def __init__(self, data, year, pro_team_schedule = None):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.posRank = json_parsing(data, 'positionalRanking')
-        self.eligibleSlots = [POSITION_MAP[pos] for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP[json_parsing(data, 'proTeamId')]
-        self.jersey = json_parsing(data, 'jersey')
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
-        self.onTeamId = json_parsing(data, 'onTeamId')
+        parsed = json_index(data)
+        self.name = parsed['fullName']
+        self.playerId = parsed['id']
+        self.posRank = parsed['positionalRanking']
+        self.eligibleSlots = [POSITION_MAP[pos] for pos in parsed['eligibleSlots']]
+        self.acquisitionType = parsed['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP[parsed['proTeamId']]
+        self.jersey = parsed['jersey']
+        self.injuryStatus = parsed['injuryStatus']
+        self.onTeamId = parsed['onTeamId']
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
         self.stats = {}
         self.schedule = {}
 
         # Get players main position
-        for pos in json_parsing(data, 'eligibleSlots'):
+        for pos in parsed['eligibleSlots']:
             if (pos != 25 and '/' not in POSITION_MAP[pos]) or '/' in self.name:
                 self.position = POSITION_MAP[pos]
                 break
 
         if pro_team_schedule:
-            pro_team_id = json_parsing(data, 'proTeamId')
+            pro_team_id = parsed['proTeamId']
             pro_team = pro_team_schedule.get(pro_team_id, {})
             for key in pro_team:
                 game = pro_team[key][0]
@@ -1,24 +1,7 @@
 # Helper functions for json parsing and power rankings
 
-def json_parsing(obj, key):
-    """Recursively pull values of specified key from nested JSON."""
-    arr = []
-
-    def extract(obj, arr, key):
-        """Return all matching values in an object."""
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                if isinstance(v, (dict)) or (isinstance(v, (list)) and  v and isinstance(v[0], (list, dict))):
-                    extract(v, arr, key)
-                elif k == key:
-                    arr.append(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                extract(item, arr, key)
-        return arr
-
-    results = extract(obj, arr, key)
-    return results[0] if results else results
+# json_parsing now lives in espn_api.utils.utils
+from espn_api.utils.utils import json_parsing
 
 def square_matrix(X):
     '''Squares a matrix'''
@@ -1,20 +1,21 @@
-from espn_api.utils.utils import json_parsing
+from espn_api.utils.utils import json_index
 from .constant import POSITION_MAP, STATS_MAP, PRO_TEAM_MAP, STATS_IDENTIFIER
 
 
 class Player(object):
 
     def __init__(self, data):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.position = POSITION_MAP.get(json_parsing(data, 'defaultPositionId') - 1
-                                         if json_parsing(data, 'defaultPositionId') and json_parsing(data, 'defaultPositionId') <= 3 
-                                         else json_parsing(data, 'defaultPositionId'), '')
+        parsed = json_index(data)
+        self.name = parsed['fullName']
+        self.playerId = parsed['id']
+        self.position = POSITION_MAP.get(parsed['defaultPositionId'] - 1
+                                         if parsed['defaultPositionId'] and parsed['defaultPositionId'] <= 3 
+                                         else parsed['defaultPositionId'], '')
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP.get(pos, '') for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP.get(json_parsing(data, 'proTeamId'), 'Unknown Team')
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
+        self.eligibleSlots = [POSITION_MAP.get(pos, '') for pos in parsed['eligibleSlots']]
+        self.acquisitionType = parsed['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP.get(parsed['proTeamId'], 'Unknown Team')
+        self.injuryStatus = parsed['injuryStatus']
         self.stats = {}
 
         '''
@@ -1,9 +1,15 @@
-import requests
 import json
+import requests
 from .constant import FANTASY_BASE_ENDPOINT, NEWS_BASE_ENDPOINT, FANTASY_SPORTS
 from ..utils.logger import Logger
+from ..utils.utils import json_dumps, json_loads
 from typing import List
 
+try:
+    from requests.exceptions import JSONDecodeError as RequestsJSONDecodeError
+except ImportError:  # requests < 2.27
+    RequestsJSONDecodeError = json.JSONDecodeError
+
 
 class ESPNAccessDenied(Exception):
     pass
@@ -27,6 +33,8 @@ class EspnFantasyRequests(object):
         self.NEWS_ENDPOINT = NEWS_BASE_ENDPOINT + FANTASY_SPORTS[sport] + '/news/' + 'players'
         self.cookies = cookies
         self.logger = logger
+        # reuse one connection pool so repeated calls skip the TCP/TLS handshake
+        self.session = requests.Session()
 
         self.LEAGUE_ENDPOINT = FANTASY_BASE_ENDPOINT + FANTASY_SPORTS[sport]
         # older season data is stored at a different endpoint
@@ -35,6 +43,13 @@ class EspnFantasyRequests(object):
         else:
             self.LEAGUE_ENDPOINT += "/seasons/" + str(year) + "/segments/0/leagues/" + str(league_id)
 
+    def _parse_response(self, r: requests.Response):
+        '''Decodes a response body, raising the same error as r.json() on bad JSON'''
+        try:
+            return json_loads(r.content)
+        except json.JSONDecodeError as e:
+            raise RequestsJSONDecodeError(e.msg, e.doc, e.pos)
+
     def checkRequestStatus(self, status: int, extend: str = "", params: dict = None, headers: dict = None) -> dict:
         '''Handles ESPN API response status codes and endpoint format switching'''
         if status == 401:
@@ -48,11 +63,11 @@ class EspnFantasyRequests(object):
                 self.LEAGUE_ENDPOINT = f"{base_endpoint}/leagueHistory/{self.league_id}?seasonId={self.year}"
 
             #try the alternate endpoint
-            r = requests.get(self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, cookies=self.cookies)
+            r = self.session.get(self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, cookies=self.cookies)
 
             if r.status_code == 200:
                 # Return the updated response if alternate works
-                return r.json()
+                return self._parse_response(r)
 
             # If all endpoints failed, raise the corresponding error
             if not self.cookies or 'espn_s2' not in self.cookies or 'SWID' not in self.cookies:
@@ -71,11 +86,11 @@ class EspnFantasyRequests(object):
 
     def league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.LEAGUE_ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        r = self.session.get(endpoint, params=params, headers=headers, cookies=self.cookies)
         alternate_response = self.checkRequestStatus(r.status_code, extend=extend, params=params, headers=headers)
 
 
-        response = alternate_response if alternate_response else r.json()
+        response = alternate_response if alternate_response else self._parse_response(r)
 
         if self.logger:
             self.logger.log_request(endpoint=self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, response=response)
@@ -84,20 +99,22 @@ class EspnFantasyRequests(object):
 
     def get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        r = self.session.get(endpoint, params=params, headers=headers, cookies=self.cookies)
         self.checkRequestStatus(r.status_code)
+        response = self._parse_response(r)
 
         if self.logger:
-            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=r.json())
-        return r.json()
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=response)
+        return response
 
     def news_get(self, params: dict = None, headers: dict = None, extend: str = ''):
         endpoint = self.NEWS_ENDPOINT + extend
-        r = requests.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        r = self.session.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        response = self._parse_response(r)
 
         if self.logger:
-            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=r.json())
-        return r.json()
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=response)
+        return response
 
     def get_league(self):
         '''Gets all of the leagues initial data (teams, roster, matchups, settings)'''
@@ -121,7 +138,7 @@ class EspnFantasyRequests(object):
             'view': 'players_wl'
         }
         filters = {"filterActive": {"value": True}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
         data = self.get(extend='/players', params=params, headers=headers)
         return data
 
@@ -144,7 +161,7 @@ class EspnFantasyRequests(object):
             base_filter = {"sortMessageDate":{"sortPriority":1,"sortAsc":False}}
             for msg_type in msg_types:
                 filters['topicsByType'][msg_type] = base_filter
-            headers = {'x-fantasy-filter': json.dumps(filters)}
+            headers = {'x-fantasy-filter': json_dumps(filters)}
 
         extend = "/segments/0/leagues/" + str(self.league_id) + '/communication'
 
@@ -159,7 +176,7 @@ class EspnFantasyRequests(object):
         if additional_filters : additional_value += additional_filters
 
         filters = {'players':{'filterIds':{'value': playerIds}, 'filterStatsForTopScoringPeriodIds':{'value': max_scoring_period, 'additionalValue': additional_value}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
 
         data = self.league_get(params=params, headers=headers)
         return data
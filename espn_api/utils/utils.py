@@ -1,4 +1,29 @@
 # Helper functions for json parsing and power rankings
+import json
+from collections import defaultdict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj) -> str:
+    """Serialize obj to a compact, ASCII-only JSON string (used for x-fantasy-filter headers)."""
+    if orjson is not None:
+        # orjson writes non-ASCII characters raw, which a latin-1 header can't carry
+        dumped = orjson.dumps(obj).decode('utf-8')
+        if dumped.isascii():
+            return dumped
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def json_loads(content):
+    """Deserialize a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 def json_parsing(obj, key):
     """Recursively pull values of specified key from nested JSON."""
@@ -19,3 +44,27 @@ def json_parsing(obj, key):
 
     results = extract(obj, arr, key)
     return results[0] if results else results
+
+
+def json_index(obj) -> defaultdict:
+    """Map every key in nested JSON to the value json_parsing would return for it.
+
+    Walks the object once, so looking up several keys is cheaper than calling
+    json_parsing for each one. Missing keys return an empty list, like json_parsing.
+    """
+    index = defaultdict(list)
+    containers = (list, dict)
+
+    def extract(obj):
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                if isinstance(v, dict) or (isinstance(v, list) and v and isinstance(v[0], containers)):
+                    extract(v)
+                elif k not in index:
+                    index[k] = v
+        elif isinstance(obj, list):
+            for item in obj:
+                extract(item)
+
+    extract(obj)
+    return index
@@ -1,10 +1,11 @@
 import datetime
 import time
-import json
 import math
+from collections import defaultdict
 from typing import List, Tuple
 
 from ..base_league import BaseLeague
+from ..utils.utils import json_dumps
 from .team import Team
 from .player import Player
 from .matchup import Matchup
@@ -33,15 +34,17 @@ class League(BaseLeague):
         return(data)
 
     def _map_matchup_ids(self, schedule):
-        self.matchup_ids = {}
+        matchup_ids = defaultdict(set)
         for match in schedule:
-            matchup_period = match.get('matchupPeriodId')
-            scoring_periods = match.get('home', {}).get('pointsByScoringPeriod', {}).keys()
-            if len(scoring_periods) > 0:
-                if matchup_period not in self.matchup_ids:
-                    self.matchup_ids[matchup_period] = sorted(scoring_periods)
-                else:
-                    self.matchup_ids[matchup_period] = sorted(set(self.matchup_ids[matchup_period] + list(scoring_periods)))
+            scoring_periods = match.get('home', {}).get('pointsByScoringPeriod', {})
+            if scoring_periods:
+                matchup_ids[match.get('matchupPeriodId')].update(scoring_periods)
+        self.matchup_ids = {matchup_period: sorted(periods) for matchup_period, periods in matchup_ids.items()}
+        # reverse lookup of scoring period -> first matchup period containing it
+        self._scoring_to_matchup = {}
+        for matchup_period, periods in self.matchup_ids.items():
+            for scoring_period in periods:
+                self._scoring_to_matchup.setdefault(scoring_period, matchup_period)
 
 
     def _fetch_teams(self, data):
@@ -51,17 +54,14 @@ class League(BaseLeague):
         # replace opponentIds in schedule with team instances
         for team in self.teams:
             team.division_name = self.settings.division_map.get(team.division_id, '')
-            for week, matchup in enumerate(team.schedule):
-                for opponent in self.teams:
-                    if matchup.away_team == opponent.team_id:
-                        matchup.away_team = opponent
-                    if matchup.home_team == opponent.team_id:
-                        matchup.home_team = opponent
+            for matchup in team.schedule:
+                matchup.away_team = self._team_by_id.get(matchup.away_team, matchup.away_team)
+                matchup.home_team = self._team_by_id.get(matchup.home_team, matchup.home_team)
 
 
 
     def standings(self) -> List[Team]:
-        standings = sorted(self.teams, key=lambda x: x.final_standing if x.final_standing != 0 else x.standing, reverse=False)
+        standings = sorted(self.teams, key=lambda x: x.final_standing or x.standing)
         return standings
 
     def scoreboard(self, matchupPeriod: int = None) -> List[Matchup]:
@@ -72,16 +72,15 @@ class League(BaseLeague):
         params = {
             'view': 'mMatchup',
         }
-        data = self.espn_request.league_get(params=params)
+        filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchupPeriod]}}}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
+        data = self.espn_request.league_get(params=params, headers=headers)
         schedule = data['schedule']
         matchups = [Matchup(matchup) for matchup in schedule if matchup['matchupPeriodId'] == matchupPeriod]
 
-        for team in self.teams:
-            for matchup in matchups:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in matchups:
+            matchup.home_team = self._team_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._team_by_id.get(matchup.away_team, matchup.away_team)
 
         return matchups
 
@@ -99,7 +98,7 @@ class League(BaseLeague):
         }
 
         filters = {"topics":{"filterType":{"value":["ACTIVITY_TRANSACTIONS"]},"limit":size,"limitPerMessageSet":{"value":25},"offset":offset,"sortMessageDate":{"sortPriority":1,"sortAsc":False},"sortFor":{"sortPriority":2,"sortAsc":False},"filterIncludeMessageTypeIds":{"value":msg_types}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
         data = self.espn_request.league_get(extend='/communication/', params=params, headers=headers)
         data = data['topics']
         activity = [Activity(topic, self.player_map, self.get_team_data) for topic in data]
@@ -127,7 +126,7 @@ class League(BaseLeague):
             'scoringPeriodId': week,
         }
         filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":slot_filter},"limit":size,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
 
         data = self.espn_request.league_get(params=params, headers=headers)
         players = data['players']
@@ -149,10 +148,7 @@ class League(BaseLeague):
             scoring_id = self.matchup_ids[matchup_period][-1] if matchup_period in self.matchup_ids else 1
         elif scoring_period and scoring_period <= scoring_id:
             scoring_id = scoring_period
-            for matchup in self.matchup_ids.keys():
-                if str(scoring_id) in self.matchup_ids[matchup]:
-                    matchup_id = matchup
-                    break
+            matchup_id = self._scoring_to_matchup.get(str(scoring_id), matchup_id)
 
         params = {
             'view': ['mMatchupScore', 'mScoreboard'],
@@ -160,17 +156,14 @@ class League(BaseLeague):
         }
 
         filters = {"schedule":{"filterMatchupPeriodIds":{"value":[matchup_id]}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': json_dumps(filters)}
         data = self.espn_request.league_get(params=params, headers=headers)
 
         schedule = data['schedule']
         pro_schedule = self._get_pro_schedule(scoring_id)
         box_data = [BoxScore(matchup, pro_schedule, matchup_total, self.year) for matchup in schedule]
 
-        for team in self.teams:
-            for matchup in box_data:
-                if matchup.home_team == team.team_id:
-                    matchup.home_team = team
-                elif matchup.away_team == team.team_id:
-                    matchup.away_team = team
+        for matchup in box_data:
+            matchup.home_team = self._team_by_id.get(matchup.home_team, matchup.home_team)
+            matchup.away_team = self._team_by_id.get(matchup.away_team, matchup.away_team)
         return box_data
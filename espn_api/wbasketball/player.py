@@ -1,17 +1,18 @@
 from .constant import POSITION_MAP, PRO_TEAM_MAP, STATS_MAP, STAT_ID_MAP
-from espn_api.utils.utils import json_parsing
+from espn_api.utils.utils import json_index
 
 class Player(object):
     '''Player are part of team'''
     def __init__(self, data, year):
-        self.name = json_parsing(data, 'fullName')
-        self.playerId = json_parsing(data, 'id')
-        self.position = POSITION_MAP[json_parsing(data, 'defaultPositionId')]
+        parsed = json_index(data)
+        self.name = parsed['fullName']
+        self.playerId = parsed['id']
+        self.position = POSITION_MAP[parsed['defaultPositionId']]
         self.lineupSlot = POSITION_MAP.get(data.get('lineupSlotId'), '')
-        self.eligibleSlots = [POSITION_MAP[pos] for pos in json_parsing(data, 'eligibleSlots')]
-        self.acquisitionType = json_parsing(data, 'acquisitionType')
-        self.proTeam = PRO_TEAM_MAP[json_parsing(data, 'proTeamId')]
-        self.injuryStatus = json_parsing(data, 'injuryStatus')
+        self.eligibleSlots = [POSITION_MAP[pos] for pos in parsed['eligibleSlots']]
+        self.acquisitionType = parsed['acquisitionType']
+        self.proTeam = PRO_TEAM_MAP[parsed['proTeamId']]
+        self.injuryStatus = parsed['injuryStatus']
         self.stats = {}
 
         # add available stats
@@ -0,0 +1,47 @@
+from unittest import TestCase, mock
+
+from espn_api.basketball import League
+
+
+class LeaguePlayerInfoTest(TestCase):
+
+    def setUp(self):
+        self.league = League.__new__(League)
+        self.league.year = 2024
+        self.league.finalScoringPeriod = 170
+        self.league.pro_schedule = {}
+        self.league.player_map = {}
+        self.league.espn_request = mock.Mock()
+        self.league.espn_request.get_player_card.side_effect = self._player_card
+        self.league.espn_request.get_player_news.side_effect = self._player_news
+
+    @staticmethod
+    def _player_card(player_ids, max_scoring_period):
+        return {'players': [
+            {'id': player_id, 'player': {'id': player_id, 'fullName': f'Player {player_id}', 'defaultPositionId': 1,
+                                         'eligibleSlots': [0], 'proTeamId': 1, 'stats': []}}
+            for player_id in player_ids
+        ]}
+
+    @staticmethod
+    def _player_news(player_id):
+        return {'news': {'feed': [{'headline': f'Headline {player_id}'}]}}
+
+    def test_player_info_news_empty(self):
+        self.assertIsNone(self.league.player_info(playerId=[], include_news=True))
+        self.league.espn_request.get_player_news.assert_not_called()
+
+    def test_player_info_news_single(self):
+        player = self.league.player_info(playerId=1, include_news=True)
+
+        self.assertEqual(player.playerId, 1)
+        self.assertEqual(player.news[0]['headline'], 'Headline 1')
+        self.league.espn_request.get_player_news.assert_called_once_with(1)
+
+    def test_player_info_news_multiple(self):
+        players = self.league.player_info(playerId=[1, 2, 3], include_news=True)
+
+        self.assertEqual([player.playerId for player in players], [1, 2, 3])
+        for player in players:
+            self.assertEqual(player.news[0]['headline'], f'Headline {player.playerId}')
+        self.assertEqual(self.league.espn_request.get_player_news.call_count, 3)
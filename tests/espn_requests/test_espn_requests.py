@@ -1,4 +1,5 @@
 from unittest import mock, TestCase
+import requests
 import requests_mock
 import io
 from espn_api.requests.espn_requests import EspnFantasyRequests
@@ -11,6 +12,13 @@ class EspnRequestsTest(TestCase):
         url_api_key = 'https://registerdisney.go.com/jgc/v5/client/ESPN-FANTASYLM-PROD/api-key?langPref=en-US'
         mock_request.post(url_api_key, status_code=400)
 
+    @requests_mock.Mocker()
+    def test_invalid_json_raises_request_exception(self, mock_request):
+        request = EspnFantasyRequests(sport='nfl', league_id=1234, year=2019)
+        mock_request.get(request.ENDPOINT, text='<html>not json</html>')
+        with self.assertRaises(requests.exceptions.RequestException):
+            request.get()
+
     # @requests_mock.Mocker()
     # @mock.patch('sys.stdout', new_callable=io.StringIO)
     # def test_authentication_api_fail(self, mock_request, mock_stdout):
@@ -384,10 +384,14 @@ class LeagueTest(TestCase):
         scoreboard = league.scoreboard(1)
         self.assertEqual(repr(scoreboard[1]), 'Matchup(Team(Watch What  You Saquon), Team(Feel the  Brees))')
         self.assertEqual(scoreboard[0].home_score, 125.5)
+        filters = json.loads(m.last_request.headers['x-fantasy-filter'])
+        self.assertEqual(filters['schedule']['filterMatchupPeriodIds']['value'], [1])
 
         scoreboard = league.scoreboard()
         self.assertEqual(repr(scoreboard[-1]), 'Matchup(Team(Jacking Goff  On Sundays), Team(Feel the  Brees))')
         self.assertEqual(scoreboard[-1].away_score, 108.64)
+        filters = json.loads(m.last_request.headers['x-fantasy-filter'])
+        self.assertEqual(filters['schedule']['filterMatchupPeriodIds']['value'], [league.current_week])
     
     @requests_mock.Mocker()
     def test_player(self, m):
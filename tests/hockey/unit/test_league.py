@@ -72,6 +72,13 @@ class BaseLeagueTest(TestCase):
         for i, actual_team in enumerate(actual_standings):
             self.assertEqual(repr(actual_team), expected_standings[i])
 
+    def test_base_league_get_team_data(self):
+        self.assertIsNone(self.league.get_team_data(9))
+        self.league._fetch_teams(self.league_data, TeamClass= Team)
+
+        self.assertEqual(repr(self.league.get_team_data(9)), 'Team(The Return of the Captain)')
+        self.assertIsNone(self.league.get_team_data(99))
+
 
 
 class HockeyLeagueTest(BaseLeagueTest):
@@ -209,3 +216,58 @@ class HockeyLeagueTest(BaseLeagueTest):
 
         mock_get_league_request.assert_called_once()
         mock_league_get_request.assert_called_once()
+
+
+class HockeyMatchupIdsTest(TestCase):
+
+    def setUp(self):
+        # scoring period 3 is listed under both matchup periods 1 and 2
+        schedule = [
+            {'matchupPeriodId': 1, 'home': {'pointsByScoringPeriod': {'1': 1.0, '2': 2.0, '3': 3.0}}},
+            {'matchupPeriodId': 1, 'home': {'pointsByScoringPeriod': {'1': 1.0, '2': 2.0}}},
+            {'matchupPeriodId': 2, 'home': {'pointsByScoringPeriod': {'3': 3.0, '4': 4.0}}},
+            {'matchupPeriodId': 3, 'home': {}},
+        ]
+        self.league = HockeyLeague.__new__(HockeyLeague)
+        self.league._map_matchup_ids(schedule)
+
+    def test_map_matchup_ids(self):
+        self.assertEqual(self.league.matchup_ids, {1: ['1', '2', '3'], 2: ['3', '4']})
+        self.assertEqual(self.league._scoring_to_matchup, {'1': 1, '2': 1, '3': 1, '4': 2})
+
+    @mock.patch.object(HockeyLeague, '_get_pro_schedule', return_value={})
+    def test_box_scores_scoring_period_uses_first_matchup(self, mock_pro_schedule):
+        self.league.year = 2021
+        self.league.currentMatchupPeriod = 2
+        self.league.current_week = 4
+        self.league.teams = []
+        self.league._team_by_id = {}
+        self.league.espn_request = mock.Mock()
+        self.league.espn_request.league_get.return_value = {'schedule': []}
+
+        self.league.box_scores(scoring_period=3)
+
+        headers = self.league.espn_request.league_get.call_args.kwargs['headers']
+        self.assertEqual(json.loads(headers['x-fantasy-filter'])['schedule']['filterMatchupPeriodIds']['value'], [1])
+
+
+class HockeyScoreboardTest(TestCase):
+
+    def setUp(self):
+        self.league = HockeyLeague.__new__(HockeyLeague)
+        self.league.currentMatchupPeriod = 13
+        self.league._team_by_id = {}
+        self.league.espn_request = mock.Mock()
+        self.league.espn_request.league_get.return_value = {'schedule': []}
+
+    def _filtered_matchup_periods(self):
+        headers = self.league.espn_request.league_get.call_args.kwargs['headers']
+        return json.loads(headers['x-fantasy-filter'])['schedule']['filterMatchupPeriodIds']['value']
+
+    def test_scoreboard_filters_matchup_period(self):
+        self.league.scoreboard(matchupPeriod=5)
+        self.assertEqual(self._filtered_matchup_periods(), [5])
+
+    def test_scoreboard_defaults_to_current_matchup_period(self):
+        self.league.scoreboard()
+        self.assertEqual(self._filtered_matchup_periods(), [13])
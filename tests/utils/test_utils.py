@@ -0,0 +1,56 @@
+from unittest import TestCase, mock, skipIf
+
+from espn_api.utils import utils
+
+
+class JsonHelpersTest(TestCase):
+    filters = {'players': {'filterIds': {'value': [1, 2]}, 'additionalValue': ['002024', 'café']}}
+
+    @mock.patch.object(utils, 'orjson', None)
+    def test_json_dumps_stdlib(self):
+        dumped = utils.json_dumps(self.filters)
+        self.assertEqual(dumped, '{"players":{"filterIds":{"value":[1,2]},"additionalValue":["002024","caf\\u00e9"]}}')
+        dumped.encode('latin-1')
+
+    @skipIf(utils.orjson is None, 'orjson is not installed')
+    def test_json_dumps_orjson(self):
+        self.assertEqual(utils.json_dumps({'a': [1, 'b']}), '{"a":[1,"b"]}')
+        # non-ASCII output falls back to the escaped stdlib form so it is header safe
+        self.assertEqual(utils.json_dumps(self.filters), '{"players":{"filterIds":{"value":[1,2]},"additionalValue":["002024","caf\\u00e9"]}}')
+
+    @mock.patch.object(utils, 'orjson', None)
+    def test_json_loads_stdlib(self):
+        self.assertEqual(utils.json_loads(b'{"a": [1, "caf\\u00e9"]}'), {'a': [1, 'café']})
+
+    @skipIf(utils.orjson is None, 'orjson is not installed')
+    def test_json_loads_orjson(self):
+        self.assertEqual(utils.json_loads(b'{"a": [1, "caf\\u00e9"]}'), {'a': [1, 'café']})
+
+
+class JsonIndexTest(TestCase):
+    data = {
+        'id': 1,
+        'player': {'id': 2, 'injuryStatus': 'ACTIVE', 'stats': [{'appliedTotal': 10}, {'appliedTotal': 20}]},
+        'eligibleSlots': [0, 1],
+        'injuryStatus': 'OUT',
+    }
+
+    def test_first_match_depth_first(self):
+        index = utils.json_index(self.data)
+        self.assertEqual(index['id'], 1)
+        # nested values are visited before later keys of the parent
+        self.assertEqual(index['injuryStatus'], 'ACTIVE')
+        self.assertEqual(index['appliedTotal'], 10)
+        for key in ('id', 'injuryStatus', 'appliedTotal', 'eligibleSlots'):
+            self.assertEqual(index[key], utils.json_parsing(self.data, key))
+
+    def test_container_values_skipped(self):
+        index = utils.json_index(self.data)
+        self.assertNotIn('player', index)
+        self.assertNotIn('stats', index)
+        # lists of scalars are kept as values
+        self.assertEqual(index['eligibleSlots'], [0, 1])
+
+    def test_missing_key(self):
+        self.assertEqual(utils.json_index(self.data)['missing'], [])
+        self.assertEqual(utils.json_parsing(self.data, 'missing'), [])